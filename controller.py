@@ -1,19 +1,36 @@
 # coding=utf-8
 
+import sys
 import typing as t
-from csv import DictReader
+from csv import reader
 from pathlib import Path
+from functools import lru_cache
+from decimal import Decimal, InvalidOperation
+from concurrent.futures import ThreadPoolExecutor
 
 from views import *
 from models import *
 
 
+# Number of rows inserted with single query
+BATCH_SIZE = 5000
+
+
+@lru_cache(maxsize=8)
+def _line(char: str, length: int) -> str:
+    """
+    Get line of specified length (built once per length)
+    """
+
+    return char * length
+
+
 def _sep(length: int = 32) -> None:
     """
     Print separator
     """
 
-    print("=" * length)
+    print(_line("=", length))
 
 
 def _subsep(length: int = 32) -> None:
@@ -21,7 +38,7 @@ def _subsep(length: int = 32) -> None:
     Print sub-separator
     """
 
-    print("-" * length)
+    print(_line("-", length))
 
 
 def _table_selector() -> t.Optional[t.Type[BaseModel]]:
@@ -35,42 +52,94 @@ def _table_selector() -> t.Optional[t.Type[BaseModel]]:
     print(
         "Select table:",
         "",
-        *(f"- {number}. {table}" for number, table in enumerate(_tables)),
-        "- X. Cancel action",
+        _TABLE_MENU,
         "",
         sep="\n"
     )
-    table_number = input(f"Type a number (0-{len(_tables) - 1}): ").strip().upper()
 
-    # Validate
+    while True:
+        table_number = input(f"Type a number (0-{len(_tables) - 1}): ").strip().upper()
 
-    if table_number == "X":
-        # Cancel
-        return None
+        # Validate
 
-    elif table_number not in map(str, range(len(_tables))):
-        # Invalid
+        if table_number == "X":
+            # Cancel
+            return None
+
+        table = _TABLES_BY_NUMBER.get(table_number)
+
+        if table is not None:
+            # Valid
+            return table
+
+        # Invalid => ask again
         print("Unknown table identifier specified")
         _subsep()
-        _table_selector()
 
-    return _tables[int(table_number)]
+
+def _fill_table(table: t.Type[BaseModel]) -> None:
+    """
+    Fill database table with initial data (within its own transaction)
+
+    Empty table is filled with COPY (file is streamed directly into database),
+    otherwise - with INSERT which skips already existing rows
+    """
+
+    data_path = Path() / "data"
+
+    with transaction(), open(data_path / (table.__table__ + ".csv"), "rt") as table_file:
+        # Get CSV fields
+        header = next(reader([table_file.readline()]))
+        columns = {column.name: column for column in table.columns}
+
+        if set(header) <= columns.keys() and not table.select(limit=1):
+            # Copy values
+            table.copy(table_file, *(columns[name] for name in header))
+            return None
+
+        # Get positions of table columns in CSV row
+        indices = [index for index, name in enumerate(header) if name in columns]
+        fields = [columns[header[index]] for index in indices]
+
+        # Insert values by batches (values are converted column by column)
+        table.insert_many(
+            fields,
+            ([row[index] for index in indices] for row in reader(table_file)),
+            batch_size=BATCH_SIZE
+        )
 
 
 def _fill() -> None:
     """
     Fill database tables with initial data
+
+    Tables are loaded concurrently by waves: each table is loaded after tables referenced by its foreign keys
     """
 
-    data_path = Path() / "data"
+    remaining = list(_tables)
+
+    while remaining:
+        # Tables which do not reference not loaded ones
+        wave = [
+            table for table in remaining
+            if not any(
+                column.foreign_key.table in remaining and column.foreign_key.table is not table
+                for column in table.columns if column.foreign_key is not None
+            )
+        ]
 
-    for table in _tables:
-        with open(data_path / (table.__table__ + ".csv"), "rt") as table_file:
-            # Initialize reader
-            data_reader = DictReader(table_file)
+        if not wave:
+            # Circular references
+            raise ValueError("Could not resolve order of tables filling")
 
-            # Insert values
-            table.insert(*(table(**row) for row in data_reader))
+        # Each table is filled with its own connection (one is left for the rest of application)
+        workers = max(1, min(len(wave), pool_size() - 1))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Wait until all tables are filled (errors are re-raised)
+            list(executor.map(_fill_table, wave))
+
+        remaining = [table for table in remaining if table not in wave]
 
     print("Success")
 
@@ -96,7 +165,7 @@ def _number_of_friends() -> None:
 
     user_id = input("Type <user.id>: ")
 
-    users = UserRelations.select(
+    friends = UserRelations.count(
         joins=(
             join(UserRelations.owner_id, User.id)
         ),
@@ -106,7 +175,7 @@ def _number_of_friends() -> None:
         )
     )
 
-    print(f"Number of friends of <user.id={user_id}>: {len(users)}")
+    print(f"Number of friends of <user.id={user_id}>: {friends}")
 
 
 def _purchase_game() -> None:
@@ -152,13 +221,8 @@ def _total_price() -> None:
     Get total price for all existing games
     """
 
-    # Select all prices
-    games = Game.select(
-        Game.price
-    )
-
     # Calculate total
-    price = sum(game.price for game in games)
+    price = Game.aggregate(Game.price, "SUM") or 0
 
     print(f"Total price of all games: {price:.2f}")
 
@@ -170,13 +234,21 @@ def _get_developer_of_game() -> None:
 
     game_name = input("Type <game.name>: ")
 
+    if "%" in game_name or "_" in game_name:
+        # Pattern specified
+        name_filter = Game.name.like(game_name)
+
+    else:
+        # Exact name => index could be used
+        name_filter = Game.name == game_name
+
     # Query with join
     developer = GameDeveloper.select(
         joins=(
             join(Game.developer_id, GameDeveloper.id)
         ),
         filters=(
-            Game.name.like(game_name)
+            name_filter
         )
     )
 
@@ -197,6 +269,16 @@ def _change_price() -> None:
     game_id = input("Type <game.id>: ")
     game_price = input("Type <game.price>: ")
 
+    try:
+        # Parse values before sending anything to database
+        game_id = int(game_id)
+        game_price = Decimal(game_price)
+
+    except (ValueError, InvalidOperation):
+        # Invalid
+        print("Invalid <game.id> or <game.price> specified")
+        return None
+
     try:
         # Update query
         Game.update(
@@ -247,10 +329,10 @@ def _generate_table() -> None:
     # Select total number
     number = input("Type <number>: ")
 
-    # Generate random table rows
-    tables = table.random(int(number))
-
-    table.print(tables)
+    # Generate (on server side), insert and output random table rows by batches
+    for tables in table.random(int(number), batch_size=BATCH_SIZE):
+        table.print(tables)
+        sys.stdout.flush()
 
 
 def _select_table() -> None:
@@ -270,6 +352,16 @@ def _select_table() -> None:
     )
 
 
+def _clear_cache() -> None:
+    """
+    Clear cached results of selection queries
+    """
+
+    clear_cache()
+
+    print("Cache cleared")
+
+
 # Existing options
 _tables = [
     GameCategory,
@@ -290,9 +382,18 @@ _actions = {
     "7": ("Change price for <game.id> to <game.price>", _change_price),
     "8": ("Select users who registered earlier than <user.created_at>", _users_register_date),
     "R": ("Generate <number> of random values for <table.name>", _generate_table),
-    "S": ("Select everything from <table.name>", _select_table)
+    "S": ("Select everything from <table.name>", _select_table),
+    "C": ("Clear cached results of selections", _clear_cache)
 }
 
+# Menus
+_TABLE_MENU = "\n".join((
+    *(f"- {number}. {table}" for number, table in enumerate(_tables)),
+    "- X. Cancel action"
+))
+_TABLES_BY_NUMBER = {str(number): table for number, table in enumerate(_tables)}
+_ACTION_MENU = "\n".join(f"- {number}. {value}" for number, (value, _) in _actions.items())
+
 
 def listen() -> None:
     """
@@ -305,20 +406,26 @@ def listen() -> None:
     print(
         "Select an action you want to do:",
         "",
-        *(f"- {number}. {value}" for number, (value, _) in _actions.items()),
+        _ACTION_MENU,
         "",
         sep="\n"
     )
     action_number = input(f"Type an action identifier: ").strip().upper()
     _subsep()
 
+    # Action from list of actions
+    _, func = _actions.get(action_number, (None, None))
+
     # Validate
 
-    if action_number not in _actions:
+    if func is None:
         # Invalid
         print("Unknown action identifier specified")
         return None
 
-    # Action from list of actions
-    func = _actions[action_number][1]
-    func()
+    try:
+        func()
+
+    finally:
+        # Output everything at once
+        sys.stdout.flush()
@@ -1,6 +1,9 @@
 # coding=utf-8
 
+import sys
+from io import TextIOWrapper
 from json import load
+from signal import signal, SIGINT
 from traceback import format_exc
 
 from models import connect
@@ -15,6 +18,15 @@ if __name__ == "__main__":
     # Connect to database
     connect(**CONFIG)
 
+    if isinstance(sys.stdout, TextIOWrapper):
+        # Do not flush output on every line (it is flushed after each action and on input)
+        sys.stdout.reconfigure(line_buffering=False)
+
+    # Exit immediately on Ctrl+C (even if error is being processed)
+    signal(SIGINT, lambda *_: sys.exit(0))
+
+    DEBUG = CONFIG["debug"]
+
     # Endless loop
     while True:
         try:
@@ -24,14 +36,10 @@ if __name__ == "__main__":
         except Exception as error:
             # Failed
 
-            if CONFIG["debug"]:
+            if DEBUG:
                 # Full traceback
                 print(format_exc())
 
             else:
                 # Only error message
                 print(f"ERROR: {error}")
-
-        except KeyboardInterrupt:
-            # Exit signal
-            exit(0)
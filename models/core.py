@@ -1,14 +1,22 @@
 # coding=utf-8
 
-import psycopg2
 import typing as t
-from re import match
+from re import compile
+from threading import Lock, local
 from time import perf_counter
+from itertools import islice
 from tabulate import tabulate
-from datetime import datetime
-from inspect import isabstract
+from datetime import datetime, timezone
+from inspect import getattr_static
+from functools import lru_cache
+from contextlib import contextmanager, suppress
 from abc import ABCMeta, abstractmethod
 from dataclasses import dataclass, field
+from collections import OrderedDict, defaultdict
+from psycopg2 import Error as DatabaseError
+from psycopg2.pool import ThreadedConnectionPool
+from psycopg2.extras import execute_values
+from psycopg2.extensions import AsIs, connection as Connection, cursor as Cursor
 
 from .expressions import JoinFunc, RandExpr
 
@@ -30,12 +38,94 @@ _WhereMethod = t.Callable[["Column[T]", Operand], WhereExpr[T]]
 Joins = t.Iterable[JoinFunc]
 Wheres = t.Iterable[WhereExpr[T]]
 
+# Supported aggregate functions
+_AGGREGATES = {"COUNT", "SUM", "AVG", "MIN", "MAX"}
+
+# Valid column name (SQL identifier)
+_NAME_RE = compile(r"\A[A-Za-z_][A-Za-z0-9_]*\Z")
+
+# Named query parameter (%(name)s)
+_PARAMETER = compile(r"%\((\w+)\)s")
+
 # Database parameters
-_connection = None
-cursor = None
+_pool: t.Optional[ThreadedConnectionPool] = None
+_local = local()
 ECHO = True
 
 
+class _QueryCache(object):
+    """
+    Thread-safe LRU cache of read queries results with per-table invalidation
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        """
+        Initialize query cache
+
+        Args:
+            maxsize (int): Maximum number of cached results
+        """
+
+        self._maxsize = maxsize
+        self._lock = Lock()
+        self._results: "OrderedDict[t.Hashable, t.Any]" = OrderedDict()
+        self._keys: t.Dict["MetaModel", t.Set[t.Hashable]] = defaultdict(set)
+
+    def get(self, key: t.Hashable, default: t.Any = None) -> t.Any:
+        """
+        Get cached result and mark it as recently used (default if not cached)
+        """
+
+        with self._lock:
+            if key not in self._results:
+                # Not cached
+                return default
+
+            self._results.move_to_end(key)
+
+            return self._results[key]
+
+    def put(self, key: t.Hashable, tables: t.Iterable["MetaModel"], result: t.Any) -> None:
+        """
+        Cache result of query which reads specified tables
+        """
+
+        with self._lock:
+            self._results[key] = result
+
+            for table in tables:
+                # Remember key for invalidation
+                self._keys[table].add(key)
+
+            if len(self._results) > self._maxsize:
+                # Drop least recently used result
+                self._results.popitem(last=False)
+
+    def pop_tables(self, tables: t.Iterable["MetaModel"]) -> None:
+        """
+        Drop cached results of queries which read specified tables
+        """
+
+        with self._lock:
+            for table in tables:
+                for key in self._keys.pop(table, ()):
+                    self._results.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Drop all cached results
+        """
+
+        with self._lock:
+            self._results.clear()
+            self._keys.clear()
+
+
+_cache = _QueryCache()
+_MISSING = object()
+_UTC = timezone.utc
+
+
 def connect(
         host: str = "localhost",
         port: t.Union[str, int] = 5432,
@@ -43,30 +133,35 @@ def connect(
         password: t.Optional[str] = None,
         database: t.Optional[str] = None,
         echo: bool = False,
+        max_connections: int = 4,
         **kwargs: t.Any
 ) -> None:
     """
-    Connect to database with specified parameters
+    Connect to database with specified parameters (connections are pooled)
     """
 
-    global _connection, cursor, ECHO
+    global _pool, ECHO
 
     print("Connecting to database...")
     start_time = perf_counter()
 
+    if _pool is not None:
+        # Reconnect
+        _pool.closeall()
+        _pool = None
+
     try:
-        # Start connection
-        _connection = psycopg2.connect(
+        # Start connections
+        _pool = ThreadedConnectionPool(
+            1,
+            max_connections,
             f"host={host} " +
             f"port={port} " +
             (f" user={username}" if username else "") +
             (f" password={password}" if password else "") +
-            (f" dbname={database}" if database else "")
+            (f" dbname={database}" if database else ""),
+            connection_factory=_Connection
         )
-        _connection.autocommit = True
-
-        # Initialize cursor
-        cursor = _connection.cursor()
 
         # Set echo parameter
         ECHO = echo
@@ -80,6 +175,155 @@ def connect(
         print(f"Successfully connected ({perf_counter() - start_time:.3f} s)")
 
 
+class _Connection(Connection):
+    """
+    Database connection which remembers prepared statements (least recently used ones are deallocated)
+    """
+
+    # Maximum number of statements prepared on single connection
+    MAX_PREPARED = 64
+
+    def __init__(self, *args: t.Any, **kwargs: t.Any) -> None:
+        """
+        Initialize connection
+        """
+
+        super(_Connection, self).__init__(*args, **kwargs)
+
+        # Query => (statement name, parameter names)
+        self.prepared: "OrderedDict[str, t.Tuple[str, t.List[str]]]" = OrderedDict()
+
+        # Number of statements ever prepared (unique statement names)
+        self.statements = 0
+
+
+@contextmanager
+def _connect() -> t.Iterator[Connection]:
+    """
+    Get connection pinned to current thread by transaction or take one from pool
+
+    Raises:
+        ConnectionError: If database is not connected
+    """
+
+    pinned = getattr(_local, "connection", None)
+
+    if pinned is not None:
+        # Within transaction
+        yield pinned
+        return
+
+    elif _pool is None:
+        # No connection
+        raise ConnectionError("Database is not connected")
+
+    pooled = _pool.getconn()
+
+    try:
+        pooled.autocommit = True
+        yield pooled
+
+    finally:
+        # Broken (closed) connections are dropped by pool
+        _pool.putconn(pooled)
+
+
+@contextmanager
+def transaction() -> t.Iterator[None]:
+    """
+    Execute all queries inside context within single transaction (nested contexts are merged)
+
+    Raises:
+        ConnectionError: If database is not connected
+    """
+
+    if getattr(_local, "connection", None) is not None:
+        # Already within transaction
+        yield
+        return
+
+    with _connect() as pinned:
+        pinned.autocommit = False
+        _local.connection = pinned
+        _local.written = set()
+
+        try:
+            yield
+
+        except BaseException:
+            # Failed => discard changes (original error is kept if connection is closed)
+            with suppress(DatabaseError):
+                pinned.rollback()
+
+            raise
+
+        else:
+            # Success => apply changes
+            pinned.commit()
+
+            # Results could be cached by other threads before commit
+            _cache.pop_tables(_local.written)
+
+        finally:
+            _local.connection = None
+            _local.written = None
+
+
+def pool_size() -> int:
+    """
+    Get maximum number of connections opened to database at once
+
+    Raises:
+        ConnectionError: If database is not connected
+    """
+
+    if _pool is None:
+        # No connection
+        raise ConnectionError("Database is not connected")
+
+    return _pool.maxconn
+
+
+def clear_cache() -> None:
+    """
+    Drop all cached results of read queries
+    """
+
+    _cache.clear()
+
+
+def batched(values: t.Iterable[V], size: int) -> t.Iterator[t.List[V]]:
+    """
+    Split values into lists of specified size (values are consumed lazily)
+
+    Args:
+        values (t.Iterable[V]): Values you want to split
+        size (int): Size of lists (the last one could be shorter)
+
+    Yields:
+        t.List[V]: Next list of values
+
+    Raises:
+        ValueError: If size is not a positive integer value
+    """
+
+    if not isinstance(size, int) or size <= 0:
+        # Invalid size
+        raise ValueError("Batch size must be positive integer value")
+
+    values = iter(values)
+
+    while True:
+        # Get next batch
+        batch = list(islice(values, size))
+
+        if not batch:
+            # No more values
+            return
+
+        yield batch
+
+
 @dataclass
 class Query(t.Generic[Q], metaclass=ABCMeta):
     """
@@ -89,6 +333,15 @@ class Query(t.Generic[Q], metaclass=ABCMeta):
     parameters: t.Dict[str, t.Any] = field(default_factory=dict)
     tables: t.List["MetaModel"] = field(default_factory=list)
 
+    # If True, results are cached until any of query tables is changed
+    _CACHED = False
+
+    # If True, query is sent with parameters in single round trip (without preparing statement)
+    _ONE_SHOT = False
+
+    # Fields converted to lists on initialization
+    _ITER_FIELDS = ("tables",)
+
     @abstractmethod
     def _render(self) -> str: ...
 
@@ -97,28 +350,131 @@ class Query(t.Generic[Q], metaclass=ABCMeta):
         Execute query
         """
 
-        if isabstract(self):
-            # Abstract query cannot be a valid query
-            raise NotImplementedError(f"Cannot execute abstract query {self!r}")
+        # Results read within transaction are not cached (uncommitted changes could be seen)
+        pinned = getattr(_local, "connection", None) is not None
+        key = self._cache_key() if self._CACHED and not pinned else None
 
-        elif cursor is None:
-            # No connection
-            raise ConnectionError("Database is not connected")
+        if key is not None:
+            result = _cache.get(key, _MISSING)
+
+            if result is not _MISSING:
+                # Already read
+                return result
+
+        self._log()
+
+        try:
+            with _connect() as connection, connection.cursor() as cursor:
+                result = self._execute(cursor)
+
+        finally:
+            if not self._CACHED:
+                # Tables could be changed
+                _cache.pop_tables(self.tables)
+
+                if pinned:
+                    # Invalidated once again on commit
+                    _local.written.update(self.tables)
+
+        if key is not None:
+            # Cache read result
+            _cache.put(key, self.tables, result)
+
+        return result
+
+    def _log(self) -> None:
+        """
+        Log query (if echo is enabled)
+        """
 
         if ECHO:
             # Log query
             print()
-            print("[", datetime.utcnow(), "]", sep="")
+            print("[", datetime.now(_UTC).isoformat(), "]", sep="")
             print(self._query)
-            print(self.parameters)
+            print(self._arguments())
             print()
 
+    def _arguments(self) -> t.Any:
+        """
+        Get query arguments (parameters)
+        """
+
+        return self.parameters
+
+    def _cache_key(self) -> t.Optional[t.Hashable]:
+        """
+        Get query cache key (None if query parameters are not hashable)
+        """
+
+        key = (self._query, tuple(sorted(self.parameters.items())))
+
+        try:
+            hash(key)
+
+        except TypeError:
+            # Could not be cached
+            return None
+
+        return key
+
+    def _execute(self, cursor: Cursor) -> Q:
+        """
+        Send query to database and retrieve data
+        """
+
         # Execute query
-        cursor.execute(self._query, self.parameters)
+        self._send(cursor)
 
         # Retrieve data
         return cursor.fetchall()
 
+    def _send(self, cursor: Cursor) -> None:
+        """
+        Execute query as prepared statement (query is prepared once per connection) or as one-shot query
+        """
+
+        if self._ONE_SHOT:
+            # Parameters are interpolated by client => single message
+            cursor.execute(self._query, self.parameters)
+            return None
+
+        connection: _Connection = cursor.connection
+
+        if self._query in connection.prepared:
+            # Already prepared => mark as recently used
+            connection.prepared.move_to_end(self._query)
+
+        else:
+            # Replace named parameters with positional ones
+            names = list(dict.fromkeys(_PARAMETER.findall(self._query)))
+            positions = {name: f"${number}" for number, name in enumerate(names, 1)}
+            statement = _PARAMETER.sub(lambda found: positions[found[1]], self._query).replace("%%", "%")
+
+            # Prepare statement
+            name = f"statement_{connection.statements}"
+            cursor.execute(f"PREPARE {name} AS {statement}")
+
+            connection.statements += 1
+            connection.prepared[self._query] = name, names
+
+            if len(connection.prepared) > connection.MAX_PREPARED:
+                # Free least recently used statement on server
+                _, (unused, _) = connection.prepared.popitem(last=False)
+                cursor.execute(f"DEALLOCATE {unused}")
+
+        name, names = connection.prepared[self._query]
+
+        if names:
+            # Pass parameters
+            cursor.execute(
+                f"EXECUTE {name}({', '.join(f'%({parameter})s' for parameter in names)})",
+                self.parameters
+            )
+
+        else:
+            cursor.execute(f"EXECUTE {name}")
+
     def __str__(self) -> str:
         """
         Return query
@@ -138,42 +494,37 @@ class Query(t.Generic[Q], metaclass=ABCMeta):
 
         return None
 
-    @classmethod
-    def _iter(cls, value: T) -> t.Union[T, t.List[T]]:
+    @staticmethod
+    def _iter(value: T) -> t.Union[T, t.List[T]]:
         """
-        Convert value to iterable (if it is not an iterable)
+        Convert value to list (if it is not a list or tuple of values)
 
         Args:
             value (T): Value you want to convert (whether iterable or no)
 
         Returns:
-            t.Union[T, t.List[T]]: Iterable value
+            t.Union[T, t.List[T]]: List of values
         """
 
-        if not hasattr(value, "__iter__"):
-            # Not an iterable
-            return [value]
-
-        # Get value types
-        _type = None
-
-        for val in value:
-            if _type is None:
-                # First
-                _type = type(val)
+        if isinstance(value, list):
+            # Already a list
+            return value
 
-            elif _type != type(val):
-                # Invalid type => not an list of values
-                return [value]
+        if not isinstance(value, tuple) or (value and isinstance(value[0], str)):
+            # Single value (single filter is a tuple too - (expression, parameters))
+            return [value]
 
-        return value
+        return list(value)
 
     def __post_init__(self) -> None:
         """
         Initialize query after init & fix some issues
         """
 
-        self.tables = self._iter(self.tables)
+        for name in self._ITER_FIELDS:
+            # Normalize iterable fields
+            setattr(self, name, self._iter(getattr(self, name)))
+
         self._query = self._render()
 
 
@@ -190,15 +541,7 @@ class _FilterQuery(Query[Q], metaclass=ABCMeta):
     limit: t.Optional[int] = None
     offset: t.Optional[int] = None
 
-    def __post_init__(self):
-        """
-        Initialize query after init & fix some issues
-        """
-
-        self.joins = self._iter(self.joins)
-        self.filters = self._iter(self.filters)
-
-        super(_FilterQuery, self).__post_init__()
+    _ITER_FIELDS = ("tables", "joins", "filters")
 
     @abstractmethod
     def _render(self) -> str:
@@ -206,7 +549,7 @@ class _FilterQuery(Query[Q], metaclass=ABCMeta):
         Render filter query part
         """
 
-        query: str = ""
+        parts: t.List[str] = []
         expression: str
 
         for join in self.joins or []:
@@ -216,11 +559,10 @@ class _FilterQuery(Query[Q], metaclass=ABCMeta):
             # Add joined table to set
             self.tables.append(table)
 
-            query += f"\n{expression} "
+            parts.append(f"\n{expression} ")
 
         if self.filters:
             # Add WHERE clause
-            query += "\nWHERE\n\t"
             query_filters: t.List[str] = []
 
             for expression, parameter in self.filters:
@@ -231,7 +573,7 @@ class _FilterQuery(Query[Q], metaclass=ABCMeta):
                     # Add parameter variable
                     self.parameters.update(parameter)
 
-            query += "\n\tAND\n\t".join(query_filters)
+            parts.append("\nWHERE\n\t" + "\n\tAND\n\t".join(query_filters))
 
         if self.order_by:
             # Add ORDER BY clause
@@ -240,7 +582,8 @@ class _FilterQuery(Query[Q], metaclass=ABCMeta):
                 # Unknown column
                 raise ValueError("Can't order by unknown column")
 
-            query += f"\nORDER BY {self.order_by} " + "ASC" if self.ascending else "DESC" + " "
+            direction = "ASC" if self.ascending else "DESC"
+            parts.append(f"\nORDER BY {self.order_by} {direction} ")
 
         if self.limit:
             # Add LIMIT clause
@@ -249,7 +592,7 @@ class _FilterQuery(Query[Q], metaclass=ABCMeta):
                 # Invalid limit value
                 raise ValueError("Query limit must be non-negative integer value")
 
-            query += f"\nLIMIT {self.limit} "
+            parts.append(f"\nLIMIT {self.limit} ")
 
         if self.offset:
             # Add offset clause
@@ -258,9 +601,9 @@ class _FilterQuery(Query[Q], metaclass=ABCMeta):
                 # Invalid offset value
                 raise ValueError("Query offset must be non-negative integer value")
 
-            query += f"\nOFFSET {self.offset} "
+            parts.append(f"\nOFFSET {self.offset} ")
 
-        return query.strip()
+        return "".join(parts).strip()
 
 
 @dataclass
@@ -269,6 +612,9 @@ class _UpdaterQuery(_FilterQuery[int], metaclass=ABCMeta):
     Database updater query class
     """
 
+    # Updates are issued rarely (preparing would cost extra round trip)
+    _ONE_SHOT = True
+
     def execute(self) -> int:
         """
         Execute updater query
@@ -289,20 +635,21 @@ class _ValuesQuery(Query[Q], metaclass=ABCMeta):
     """
 
     values: t.List["BaseModel"] = field(default_factory=list)
+    rows: t.List[t.Tuple[t.Any, ...]] = field(default_factory=list, init=False)
 
-    def __post_init__(self):
+    _ITER_FIELDS = ("tables", "values")
+
+    def _arguments(self) -> t.Any:
         """
-        Initialize query after init & fix some issues
+        Get query arguments (rows of values)
         """
 
-        self.values = self._iter(self.values)
-
-        super(_ValuesQuery, self).__post_init__()
+        return self.rows
 
     @abstractmethod
     def _render(self) -> str:
         """
-        Render values (asignment) query class
+        Render values (asignment) query class (values are passed as rows for single %s placeholder)
         """
 
         query = ""
@@ -314,47 +661,48 @@ class _ValuesQuery(Query[Q], metaclass=ABCMeta):
             raise ValueError("INSERT can be performed only for single table")
 
         # Get inserted columns
-        columns = list(inserted.columns)
+        columns = inserted.columns
 
         if columns and self.values:
             # Values exist
-            query += "\nVALUES"
+            query += "\nVALUES %s"
+
+            # Column names of each inserted class (collected once per class, not per row)
+            value_columns: t.Dict[type, t.Set[str]] = {}
 
-            for number, value in enumerate(self.values):
+            for value in self.values:
                 if not isinstance(value, inserted):
                     # Unknown table
                     raise TypeError(f"Incompatible inserted table - {value.__table__}")
 
-                query += "\n\t("
+                names = value_columns.get(type(value))
 
-                for column in columns:
-                    for value_column in value.columns:  # type: ignore
-                        if value_column.name == column.name:
-                            # Column found
-                            break
+                if names is None:
+                    # New class of values
+                    names = value_columns[type(value)] = {
+                        value_column.name for value_column in value.columns  # type: ignore
+                    }
 
-                    else:
+                row = []
+
+                for column in columns:
+                    if column.name not in names:
                         # Not found ???
                         raise ValueError(f"Column {column.name!r} not found in {value!r}")
 
-                    if isinstance(getattr(value, column.name), RandExpr):
+                    column_value = getattr(value, column.name)
+
+                    if isinstance(column_value, RandExpr):
                         # Insert directly into query
-                        query += f"{getattr(value, column.name).value}, "
+                        row.append(AsIs(column_value.value))
 
                     else:
                         # # Check if ok
                         # column.validate(value)
 
-                        # Get value name
-                        name = f"{column.table.__table__}_{column.name}_{number}"
-
-                        self.parameters[name] = getattr(value, column.name)
-                        query += f"%({name})s, "
+                        row.append(column_value)
 
-                query = query[:-2]  # Remove last separator
-                query += "),"
-
-            query = query[:-1]  # Remove last separator
+                self.rows.append(tuple(row))
 
         return query
 
@@ -368,14 +716,9 @@ class SelectQuery(_FilterQuery[T], t.Generic[T]):
 
     columns: t.List["Column"] = field(default_factory=list)
 
-    def __post_init__(self):
-        """
-        Initialize query after init & fix some issues
-        """
-
-        self.columns = self._iter(self.columns)
+    _CACHED = True
 
-        super(SelectQuery, self).__post_init__()
+    _ITER_FIELDS = ("tables", "joins", "filters", "columns")
 
     def _render(self) -> str:
         """
@@ -402,20 +745,113 @@ class SelectQuery(_FilterQuery[T], t.Generic[T]):
         Execute selection query
         """
 
-        results: t.List[T] = []
+        return list(self._tables(super(SelectQuery, self).execute()))
+
+    def iterate(self, itersize: int = 2000) -> t.Iterator[T]:
+        """
+        Execute selection query and yield rows lazily (read from server-side cursor by chunks, not cached)
+
+        Args:
+            itersize (int): Number of rows fetched from database at once
+
+        Yields:
+            T: Next selected row
+        """
+
+        if _pool is None:
+            # No connection
+            raise ConnectionError("Database is not connected")
+
+        self._log()
+
+        # Dedicated connection (not pinned to thread, so queries made while iterating use their own ones)
+        connection = _pool.getconn()
+
+        try:
+            # Server-side cursor lives within transaction (it is kept open until rows are read)
+            connection.autocommit = False
+
+            with connection.cursor(name=f"select_{id(self)}") as cursor:
+                cursor.itersize = itersize
+
+                # Server-side cursor is declared for query itself (not for prepared statement)
+                cursor.execute(self._query, self.parameters)
+
+                yield from self._tables(cursor)
+
+        except BaseException:
+            # Failed or not read till the end (closed connection could not be rolled back)
+            with suppress(DatabaseError):
+                connection.rollback()
+
+            raise
+
+        else:
+            # All rows are read
+            connection.commit()
+
+        finally:
+            _pool.putconn(connection)
+
+    def _tables(self, rows: t.Iterable[t.Tuple[t.Any, ...]]) -> t.Iterator[T]:
+        """
+        Initialize tables from selected rows
+        """
+
         columns = list(self.columns or self.table.columns)
 
-        for row in super(SelectQuery, self).execute():
+        for row in rows:
             # Initialize table
             table = self.table()
 
-            for number, value in enumerate(row):
-                # Set table column value
-                setattr(table, columns[number].name, value)
+            for column, value in zip(columns, row):
+                # Set table column value (as read from database)
+                column._fast_set(table, value)
 
-            results.append(table)
+            yield table
 
-        return results
+
+@t.final
+@dataclass
+class AggregateQuery(_FilterQuery[T], t.Generic[T]):
+    """
+    SELECT query with aggregate function
+    """
+
+    function: str = "COUNT"
+    column: t.Optional["Column"] = None
+
+    _CACHED = True
+
+    def _render(self) -> str:
+        """
+        Render aggregation query
+        """
+
+        if self.function.upper() not in _AGGREGATES:
+            # Unknown function
+            raise ValueError(f"Unknown aggregate function {self.function!r}")
+
+        query = (
+            f"SELECT {self.function.upper()}({self.column or '*'})\n"
+            f"FROM {self.table}\n"  # type: ignore
+        )
+
+        query += super(AggregateQuery, self)._render()
+
+        return query.strip()
+
+    def _execute(self, cursor: Cursor) -> T:
+        """
+        Execute aggregation query
+
+        Returns:
+            T: Aggregated value
+        """
+
+        self._send(cursor)
+
+        return cursor.fetchone()[0]
 
 
 @t.final
@@ -426,6 +862,10 @@ class InsertQuery(_ValuesQuery[T], t.Generic[T]):
     """
 
     upsert: bool = False
+    page_size: t.Optional[int] = None  # Rows per statement (all rows if None)
+
+    # Values differ every time (rows are sent with execute_values)
+    _ONE_SHOT = True
 
     def _render(self) -> str:
         """
@@ -435,31 +875,54 @@ class InsertQuery(_ValuesQuery[T], t.Generic[T]):
         query = super(InsertQuery, self)._render()
 
         if query:
+            columns = ", ".join(column.name for column in self.table.columns)
+            primary_keys = ", ".join(column.name for column in self.table.primary_keys)
+            updated = [column.name for column in self.table.columns if not column.primary_key]
+
             # Add INSERT clause
             query = (
                 f"INSERT INTO {self.table}\n"  # type: ignore
-                f"\t({', '.join((column.name for column in self.table.columns))}) "
+                f"\t({columns}) "
                 + query
+                + (f"\nON CONFLICT ({primary_keys})" if primary_keys else "\nON CONFLICT")
             )
 
-            if self.upsert:
-                # Update on conflict
-                query += (
-                    f"\nON CONFLICT"
-                    f"\n\t({', '.join((column.name for column in self.table.primary_keys))})"
-                    f"\nDO UPDATE {self.table}"  # type: ignore
-                    f"\nSET\n\t"
-                    + "\n\t".join((f"\"{column.name}\" = {column}" for column in self.table.columns))
-                )
+            if self.upsert and primary_keys and updated:
+                # Update conflicting rows with inserted values
+                query += "\nDO UPDATE SET\n\t" + ",\n\t".join(f"{name} = EXCLUDED.{name}" for name in updated)
+
+            else:
+                # Skip conflicting rows
+                query += " DO NOTHING"
 
             query += (
-                f"\nON CONFLICT ({', '.join((column.name for column in self.table.primary_keys))}) DO NOTHING"
                 f"\nRETURNING\n"  # Return values to update in case of autoincrement sequences
-                f"\t({', '.join((column.name for column in self.table.columns))})"  # ^^^ or default values
+                f"\t{columns}"  # ^^^ or default values
             )
 
         return query.strip()
 
+    def _execute(self, cursor: Cursor) -> t.List[t.Tuple[t.Any, ...]]:
+        """
+        Insert rows by pages (single statement per page)
+
+        Returns:
+            t.List[t.Tuple[t.Any, ...]]: Inserted rows
+        """
+
+        if not self._query:
+            # Nothing to insert
+            return []
+
+        return execute_values(
+            cursor,
+            self._query,
+            self.rows,
+            template=f"({', '.join(['%s'] * len(self.rows[0]))})",
+            page_size=self.page_size or len(self.rows),
+            fetch=True
+        )
+
 
 @t.final
 @dataclass
@@ -475,46 +938,41 @@ class UpdateQuery(_UpdaterQuery):
         Render update query
         """
 
-        query = ""
-        updated_column = ""
-
-        if self.values:
-            # Update columns
-            query = (
-                f"UPDATE {self.table}\n"  # type: ignore
-                f"SET"
-            )
+        if not self.values:
+            # Nothing to update
+            return ""
 
-            for updated_column, value in self.values.items():
-                for column in self.table.columns:
-                    if column.name == updated_column:
-                        # Found column
-                        break
-
-                else:
-                    # Not found ???
-                    raise ValueError(
-                        f"Column {updated_column!r} not found "
-                        f"in table '{self.table.__table__}'"  # type: ignore
-                    )
+        assignments: t.List[str] = []
+        table_columns = {column.name: column for column in self.table.columns}
 
-                # Check if ok
-                column.validate(value)
+        for updated_column, value in self.values.items():
+            column = table_columns.get(updated_column)
 
-                # Get value name
-                name = f"{column.table.__table__}_{column.name}"  # type: ignore
+            if column is None:
+                # Not found ???
+                raise ValueError(
+                    f"Column {updated_column!r} not found "
+                    f"in table '{self.table.__table__}'"  # type: ignore
+                )
 
-                # Add column to list
-                query += f"\n\t{column.name} = %({name})s,"
-                self.parameters[name] = value
+            # Check if ok
+            column.validate(value)
 
-            query = query[:-1] + "\n"
-            query += super(UpdateQuery, self)._render()
+            # Get value name
+            name = f"{column.table.__table__}_{column.name}"  # type: ignore
 
-            # Return to get total number
-            query += f"\nRETURNING {updated_column}"
+            # Add column to list
+            assignments.append(f"{column.name} = %({name})s")
+            self.parameters[name] = value
 
-        return query
+        return "".join((
+            f"UPDATE {self.table}\n"  # type: ignore
+            f"SET\n\t",
+            ",\n\t".join(assignments),
+            "\n",
+            super(UpdateQuery, self)._render(),
+            f"\nRETURNING {updated_column}"  # Return to get total number
+        ))
 
 
 @t.final
@@ -543,6 +1001,138 @@ class DeleteQuery(_UpdaterQuery):
             return ""
 
 
+@t.final
+@dataclass
+class CopyQuery(Query[int]):
+    """
+    COPY ... FROM STDIN query
+    """
+
+    _ONE_SHOT = True
+
+    file: t.Optional[t.TextIO] = None
+    columns: t.List["Column"] = field(default_factory=list)
+
+    def _render(self) -> str:
+        """
+        Render copy query
+        """
+
+        copied = ", ".join((column.name for column in self.columns or self.table.columns))
+
+        return (
+            f"COPY {self.table}\n"  # type: ignore
+            f"\t({copied})\n"
+            f"FROM STDIN WITH (FORMAT csv)"
+        )
+
+    def _execute(self, cursor: Cursor) -> int:
+        """
+        Stream CSV file into table
+
+        Returns:
+            int: Number of copied rows
+        """
+
+        if self.file is None:
+            # Nothing to copy
+            raise ValueError("COPY requires file to read rows from")
+
+        cursor.copy_expert(self._query, self.file)
+
+        return cursor.rowcount
+
+
+@t.final
+@dataclass
+class RandomQuery(Query[t.List[T]], t.Generic[T]):
+    """
+    INSERT ... SELECT FROM generate_series(...) query (random rows are generated by database)
+    """
+
+    number: int = 1
+
+    def _render(self) -> str:
+        """
+        Render random insertion query
+        """
+
+        # Columns without random expression get default values
+        expressions = {
+            name: expression for name, expression in self.table._random_columns().items()  # type: ignore
+            if expression is not None
+        }
+
+        if not expressions:
+            # Nothing to generate
+            return ""
+
+        columns = ", ".join(expressions)
+        primary_keys = ", ".join(column.name for column in self.table.primary_keys)
+
+        # Parameter is bound by name => stays the same for every batch size
+        self.parameters["number"] = self.number
+
+        return (
+            f"INSERT INTO {self.table}\n"  # type: ignore
+            f"\t({columns})\n"
+            "SELECT\n\t"
+            + ",\n\t".join(expression.value for expression in expressions.values()) +
+            "\nFROM generate_series(1, %(number)s)\n"
+            + (f"ON CONFLICT ({primary_keys}) DO NOTHING\n" if primary_keys else "ON CONFLICT DO NOTHING\n") +
+            "RETURNING\n\t"
+            + ", ".join(column.name for column in self.table.columns)
+        )
+
+    def execute(self) -> t.List[T]:
+        """
+        Execute random insertion query
+
+        Returns:
+            t.List[T]: Inserted tables
+        """
+
+        if not self._query:
+            # Nothing to insert
+            return []
+
+        results: t.List[T] = []
+        columns = self.table.columns
+
+        for row in super(RandomQuery, self).execute():
+            # Initialize table
+            table = self.table()
+
+            for column, value in zip(columns, row):
+                # Set table column value (as read from database)
+                column._fast_set(table, value)
+
+            results.append(table)
+
+        return results
+
+
+@lru_cache(maxsize=None)
+def _random_reference(column: str, table: str) -> RandExpr:
+    """
+    Get random expression selecting one of referenced values (shared by all columns referencing it)
+
+    Referenced values are read once per query (subqueries are not correlated), index is random per row
+
+    Args:
+        column (str): Referenced column name
+        table (str): Referenced table name
+
+    Returns:
+        RandExpr: Random expression
+    """
+
+    return RandExpr.of(
+        f"(SELECT ARRAY_AGG({column}) FROM {table})"
+        f"[CAST(FLOOR(RANDOM() * (SELECT COUNT(*) FROM {table})) AS INTEGER) + 1]"
+    )
+
+
 class _classproperty(object):
     """
     Combine classmethod & property
@@ -580,9 +1170,16 @@ def operator_factory(operator: str, name: str) -> _WhereMethod[T]:
             # Compare with literal value => validate
             self.validate(other)
 
-            # Format parameter
-            _name = f"{self.table.__table__}_{self.name}_{name}"  # type: ignore # TODO: FIX
-            value, param = f"%({_name})s", {_name: other}
+            # Expression and parameter name are formatted once per column binding
+            formatted = self._expressions.get(name)
+
+            if formatted is None:
+                _name = f"{self.table.__table__}_{self.name}_{name}"  # type: ignore # TODO: FIX
+                formatted = self._expressions[name] = f"{self} {operator} %({_name})s", _name
+
+            expression, _name = formatted
+
+            return expression, {_name: other}
 
         return f"{self} {operator} {value}", param
 
@@ -595,7 +1192,7 @@ class Column(t.Generic[T], metaclass=ABCMeta):
     """
 
     type: str  # PostgreSQL type name
-    _TYPES: t.Set[t.Type]  # Compatible types
+    _TYPES: t.Tuple[t.Type, ...]  # Compatible types
 
     __slots__ = (
         "name",
@@ -605,6 +1202,10 @@ class Column(t.Generic[T], metaclass=ABCMeta):
         "table",
         "foreign_key",
         "_default",
+        "_qualified",
+        "_hash",
+        "_expressions",
+        "_priv_name",
     )
 
     def __init__(
@@ -628,17 +1229,20 @@ class Column(t.Generic[T], metaclass=ABCMeta):
             foreign_key (t.Optional(Column[T])): Specify referenced column if it is a foreign key
 
         Raises:
-            ValueError: If name contains invalid characters (not in range [A-Za-z0-9_])
+            ValueError: If name is not a valid identifier ([A-Za-z_] followed by [A-Za-z0-9_])
             TypeError: If type is unknown (not an attribute of 'Types' subclass)
         """
 
-        if not match(r"[A-Za-z0-9_]", name):
+        if not _NAME_RE.match(name):
             # Invalid name
             raise ValueError(f"Invalid column name {name!r}")
 
         self.name = name
         self.foreign_key = foreign_key
 
+        # Name of instance slot which stores column value
+        self._priv_name = "_" + name
+
         # Constraints
         self.primary_key = bool(primary_key)
 
@@ -648,6 +1252,13 @@ class Column(t.Generic[T], metaclass=ABCMeta):
         # Default value
         self._default = default
 
+        # "<table>"."<column>" (built once column is bound to table)
+        self._qualified: t.Optional[str] = None
+        self._hash = hash(self.name)
+
+        # Operator name => (expression, parameter name)
+        self._expressions: t.Dict[str, t.Tuple[str, str]] = {}
+
     def __get__(self, instance: t.Optional["BaseModel"], owner: "MetaModel") -> t.Union[T, "Column[T]"]:
         """
         Get column instance or value
@@ -662,11 +1273,18 @@ class Column(t.Generic[T], metaclass=ABCMeta):
 
         if isinstance(instance, BaseModel):
             # Instance specified
-            return getattr(instance, "_" + self.name, self.default)
+            return getattr(instance, self._priv_name, self.default)
 
         else:
             # Return column with table
-            self.table = owner
+
+            if getattr(self, "table", None) is not owner:
+                # (Re)bind column => qualified name has to be built again
+                self.table = owner
+                self._qualified = None
+                self._hash = hash((owner, self.name))
+                self._expressions = {}
+
             return self
 
     def __set__(self, instance: "BaseModel", value: T) -> None:
@@ -678,14 +1296,27 @@ class Column(t.Generic[T], metaclass=ABCMeta):
             value (T): Column value you want to set
         """
 
-        setattr(instance, "_" + self.name, self.convert(value))
+        setattr(instance, self._priv_name, self.convert(value))
+
+    def _fast_set(self, instance: "BaseModel", value: T) -> None:
+        """
+        Set column value read from database (it already has column type => not converted)
+
+        Args:
+            instance (BaseModel): Column table instance
+            value (T): Column value you want to set
+        """
+
+        setattr(instance, self._priv_name, value)
 
     def __hash__(self) -> int:
         """
-        Get column hash
+        Get column hash (computed once column is bound to table)
+
+        Note: '==' builds SQL expression, so use 'is' to compare columns themselves
         """
 
-        return hash(str(self))
+        return self._hash
 
     @classmethod
     def convert(cls, value: t.Any) -> T:
@@ -699,7 +1330,7 @@ class Column(t.Generic[T], metaclass=ABCMeta):
             TypeError: If value is not compatible with type
         """
 
-        if type(value) in {RandExpr, *cls._TYPES}:
+        if type(value) in cls._TYPES or type(value) is RandExpr:
             # Valid type
             return value
 
@@ -717,13 +1348,35 @@ class Column(t.Generic[T], metaclass=ABCMeta):
             f"to be compatible with column of type {cls.type}"
         )
 
-    def validate(self, value: T) -> None:
+    @classmethod
+    def convert_many(cls, values: t.Iterable[t.Any]) -> t.List[T]:
+        """
+        Convert specified values to column type (values of compatible types are kept as is)
+
+        Args:
+            values (t.Iterable[t.Any]): Values you want to convert
+
+        Returns:
+            t.List[T]: Converted values
+
+        Raises:
+            TypeError: If any value is not compatible with type
+        """
+
+        types, convert = cls._TYPES, cls.convert
+
+        return [value if type(value) in types else convert(value) for value in values]
+
+    def validate(self, value: T) -> T:
         """
         Check if value is valid for column type
 
         Args:
             value (T): Value you want to validate
 
+        Returns:
+            T: Value converted to column type
+
         Raises:
             ValueError: If value violates NOT NULL constraint
             TypeError: If invalid value type provided
@@ -738,7 +1391,7 @@ class Column(t.Generic[T], metaclass=ABCMeta):
 
         try:
             # Check if compatible
-            self.convert(value)
+            return self.convert(value)
 
         except (TypeError, ValueError):
             # Invalid type
@@ -747,6 +1400,49 @@ class Column(t.Generic[T], metaclass=ABCMeta):
                 f"{value!r} ({type(value)})"
             )
 
+    def validate_many(self, values: t.Iterable[T]) -> t.List[T]:
+        """
+        Check if all values are valid for column type
+
+        Args:
+            values (t.Iterable[T]): Values you want to validate
+
+        Returns:
+            t.List[T]: Values converted to column type
+
+        Raises:
+            ValueError: If any value violates NOT NULL constraint (first one is reported)
+            TypeError: If invalid value type provided (first one is reported)
+        """
+
+        values = list(values)
+
+        if self.not_null and None in values:
+            # NOT NULL violation
+            raise ValueError(
+                f"Invalid value at index {values.index(None)} - "
+                f"NOT NULL constraint violation"
+            )
+
+        try:
+            # Check if compatible
+            return self.convert_many(values)
+
+        except (TypeError, ValueError):
+            for index, value in enumerate(values):
+                try:
+                    # Find first invalid value
+                    self.convert_many((value, ))
+
+                except (TypeError, ValueError):
+                    # Invalid type
+                    raise TypeError(
+                        f"Invalid value for type {self.type!r} provided at index {index} - "
+                        f"{value!r} ({type(value)})"
+                    )
+
+            raise
+
     @property
     def default(self) -> T:
         """
@@ -783,7 +1479,11 @@ class Column(t.Generic[T], metaclass=ABCMeta):
             str: Column name
         """
 
-        return f"\"{self.table.__table__}\".\"{self.name}\""  # type: ignore # TODO: FIX
+        if self._qualified is None:
+            # Build once per binding
+            self._qualified = f"\"{self.table.__table__}\".\"{self.name}\""  # type: ignore # TODO: FIX
+
+        return self._qualified
 
     @abstractmethod
     def random(self) -> t.Optional[RandExpr]:
@@ -793,13 +1493,7 @@ class Column(t.Generic[T], metaclass=ABCMeta):
 
         if self.foreign_key is not None:
             # Values subquery
-            return RandExpr(
-                value=(
-                    f"(SELECT {self.foreign_key.name}"
-                    f" FROM {self.foreign_key.table}"
-                    f" ORDER BY RANDOM() LIMIT 1)"
-                )
-            )
+            return _random_reference(self.foreign_key.name, str(self.foreign_key.table))
 
     __eq__ = operator_factory("=", "eq")
     __ne__ = operator_factory("!=", "ne")
@@ -814,33 +1508,57 @@ class MetaModel(type, t.Generic[T]):
     Table model metaclass
     """
 
+    def __new__(mcs, name: str, bases: t.Tuple[type, ...], namespace: t.Dict[str, t.Any], **kwargs: t.Any):
+        """
+        Create table model & store values of its columns in slots (instead of instance dict)
+        """
+
+        namespace["__slots__"] = tuple(
+            value._priv_name for value in namespace.values() if isinstance(value, Column)
+        ) + tuple(namespace.get("__slots__", ()))
+
+        return super(MetaModel, mcs).__new__(mcs, name, bases, namespace, **kwargs)
+
+    def __init__(cls, *args: t.Any, **kwargs: t.Any) -> None:
+        """
+        Initialize table model & collect its columns (once per model)
+        """
+
+        super(MetaModel, cls).__init__(*args, **kwargs)
+
+        cls.__columns__ = tuple(
+            getattr(cls, attr) for attr in dir(cls)
+            if isinstance(getattr_static(cls, attr), Column)
+        )
+        cls.__primary_keys__ = tuple(
+            column for column in cls.__columns__ if column.primary_key
+        )
+
+        if hasattr(cls, "__table__"):
+            # Table name with schema (built once per model)
+            cls.__qualified__ = f"\"{cls.__schema__}\".\"{cls.__table__}\""
+
     @property
-    def columns(cls) -> t.Generator[Column, None, None]:
+    def columns(cls) -> t.Tuple[Column, ...]:
         """
         Get model columns
 
-        Yields:
-            Column: Model columns
+        Returns:
+            t.Tuple[Column, ...]: Model columns
         """
 
-        for attr in dir(cls):
-            if isinstance(getattr(cls, attr), Column):
-                # Column type
-                yield getattr(cls, attr)
+        return cls.__columns__
 
     @property
-    def primary_keys(cls) -> t.Generator[Column, None, None]:
+    def primary_keys(cls) -> t.Tuple[Column, ...]:
         """
         Get model primary keys
 
-        Yieds:
-            Column: Model columns defined as primary keys
+        Returns:
+            t.Tuple[Column, ...]: Model columns defined as primary keys
         """
 
-        for column in cls.columns:
-            if column.primary_key:
-                # Defined as primary key
-                yield column
+        return cls.__primary_keys__
 
     def print(cls, tables: t.List["BaseModel[T]"]) -> None:
         """
@@ -863,6 +1581,86 @@ class MetaModel(type, t.Generic[T]):
             headers="firstrow"
         ))
 
+    def count(
+            cls,
+            joins: t.Optional[Joins] = None,
+            filters: t.Optional[Wheres] = None
+    ) -> int:
+        """
+        Execute SELECT COUNT(*) query on table
+
+        Args:
+            joins (t.Optional[Joins]): Selection joins (JOIN ON clause)
+            filters (t.Optional[Wheres]): Selection filters (WHERE clause)
+
+        Returns:
+            int: Number of selected rows
+        """
+
+        query = AggregateQuery(
+            tables=[cls],
+            joins=joins or [],
+            filters=filters or []
+        )
+
+        return query.execute()
+
+    def aggregate(
+            cls,
+            column: Column,
+            function: str,
+            joins: t.Optional[Joins] = None,
+            filters: t.Optional[Wheres] = None
+    ) -> t.Any:
+        """
+        Execute SELECT query with aggregate function on table
+
+        Args:
+            column (Column): Aggregated column
+            function (str): Aggregate function name (COUNT, SUM, AVG, MIN or MAX)
+            joins (t.Optional[Joins]): Selection joins (JOIN ON clause)
+            filters (t.Optional[Wheres]): Selection filters (WHERE clause)
+
+        Returns:
+            t.Any: Aggregated value (None if nothing selected)
+        """
+
+        query = AggregateQuery(
+            tables=[cls],
+            function=function,
+            column=column,
+            joins=joins or [],
+            filters=filters or []
+        )
+
+        return query.execute()
+
+    def from_rows(
+            cls,
+            columns: t.Sequence[Column],
+            rows: t.Iterable[t.Sequence[t.Any]]
+    ) -> t.List["BaseModel[T]"]:
+        """
+        Initialize tables from positional values (values are validated and converted column by column)
+
+        Args:
+            columns (t.Sequence[Column]): Columns in order of row values
+            rows (t.Iterable[t.Sequence[t.Any]]): Rows of column values
+
+        Returns:
+            t.List[BaseModel[T]]: Tables with specified values
+        """
+
+        rows = list(rows)
+        tables = [cls() for _ in rows]
+
+        for index, column in enumerate(columns):
+            for table, value in zip(tables, column.validate_many([row[index] for row in rows])):
+                # Set converted table column value
+                column._fast_set(table, value)
+
+        return tables
+
     def select(
             cls,
             *columns: Column,
@@ -902,10 +1700,52 @@ class MetaModel(type, t.Generic[T]):
 
         return query.execute()
 
+    def iter_select(
+            cls,
+            *columns: Column,
+            joins: t.Optional[Joins] = None,
+            filters: t.Optional[Wheres] = None,
+            order_by: t.Optional[Column] = None,
+            ascending: bool = True,
+            limit: t.Optional[int] = None,
+            offset: t.Optional[int] = None,
+            itersize: int = 2000
+    ) -> t.Iterator["MetaModel[T]"]:
+        """
+        Execute SELECT query on table and stream rows (for results too large to be read at once)
+
+        Args:
+            *columns (Column): Specify column you want to select. If none provided, selects all
+            joins (t.Optional[Joins]): Selection joins (JOIN ON clause)
+            filters (t.Optional[Wheres]): Selection filters (WHERE clause)
+            order_by (t.Optional[Column]): If specified, sorts results by this column (ORDER BY clause)
+            ascending (bool): If 'order_by' specified, sets sort order (ASC/DESC clause)
+            limit (t.Optional[int]): If specified, limits number of rows with this number (LIMIT clause)
+            offset (t.Optional[int]): If specified, skips this number of first rows (OFFSET clause)
+            itersize (int): Number of rows fetched from database at once
+
+        Yields:
+            MetaModel[T]: Next selected row
+        """
+
+        query = SelectQuery(
+            tables=[cls],
+            columns=list(columns),
+            joins=joins or [],
+            filters=filters or [],
+            order_by=order_by,
+            ascending=ascending,
+            limit=limit,
+            offset=offset
+        )
+
+        yield from query.iterate(itersize)
+
     def insert(
             cls,
             *values: "BaseModel[T]",
-            upsert: bool = False
+            upsert: bool = False,
+            page_size: t.Optional[int] = None
     ) -> None:
         """
         Execute INSERT query on table
@@ -913,48 +1753,89 @@ class MetaModel(type, t.Generic[T]):
         Args:
             *values (BaseModel[T]): Specify tables you want to insert
             upsert (bool): If True, updates conflicting rows
+            page_size (t.Optional[int]): Number of tables sent with single statement. If None, sends all at once
         """
 
         query = InsertQuery(
             tables=[cls],
             values=list(values),
-            upsert=upsert
+            upsert=upsert,
+            page_size=page_size
         )
 
-        # Insert values and get them (returned as str)
-        inserted = [
-            value[1:-1].replace("\"", "").replace("'", "").split(",")
-            for value, *_ in query.execute()
-        ]
+        # Insert values and get them
+        inserted = query.execute()
+        columns = cls.columns
 
         if len(inserted) < len(values):
             # Not all has been inserted => update by primary keys
-            for insert in inserted:
-                for table in values:
-                    for index, column in enumerate(cls.columns):
-                        if column.primary_key:
-                            if str(getattr(table, column.name)) != insert[index]:
-                                # Not this row
-                                break
+            keys = [index for index, column in enumerate(columns) if column.primary_key]
+            by_key = {
+                tuple(str(getattr(table, columns[index].name)) for index in keys): table
+                for table in values
+            }
 
-                    else:
-                        # Found row
-                        break
+            for row in inserted:
+                table = by_key.get(tuple(str(row[index]) for index in keys))
 
-                else:
+                if table is None:
                     # Row not found?
                     continue
 
-                for index, column in enumerate(cls.columns):
+                for column, value in zip(columns, row):
                     # Update table value
-                    setattr(table, column.name, insert[index])
+                    setattr(table, column.name, value)
 
         else:
             # All has been inserted => update by order
-            for index, column in enumerate(cls.columns):
-                for number, table in enumerate(values):
+            for table, row in zip(values, inserted):
+                for column, value in zip(columns, row):
                     # Update table value
-                    setattr(table, column.name, inserted[number][index])
+                    setattr(table, column.name, value)
+
+    def copy(
+            cls,
+            file: t.TextIO,
+            *columns: Column
+    ) -> int:
+        """
+        Execute COPY query on table (file is streamed without being parsed)
+
+        Args:
+            file (t.TextIO): CSV-formatted file (without header) you want to copy
+            *columns (Column): Columns in order of CSV fields. If none provided, uses all
+
+        Returns:
+            int: Number of copied rows
+        """
+
+        query = CopyQuery(
+            tables=[cls],
+            file=file,
+            columns=list(columns)
+        )
+
+        return query.execute()
+
+    def insert_many(
+            cls,
+            columns: t.Sequence[Column],
+            rows: t.Iterable[t.Sequence[t.Any]],
+            batch_size: int = 1000,
+            upsert: bool = False
+    ) -> None:
+        """
+        Execute INSERT queries on table by batches of positional values (rows are consumed lazily)
+
+        Args:
+            columns (t.Sequence[Column]): Columns in order of row values
+            rows (t.Iterable[t.Sequence[t.Any]]): Rows of column values you want to insert
+            batch_size (int): Number of rows inserted with single query (single round trip)
+            upsert (bool): If True, updates conflicting rows
+        """
+
+        for batch in batched(rows, batch_size):
+            cls.insert(*cls.from_rows(columns, batch), upsert=upsert, page_size=batch_size)
 
     def update(
             cls,
@@ -1027,27 +1908,34 @@ class MetaModel(type, t.Generic[T]):
             str: "<schema>"."<table>"-formatted string
         """
 
-        return (
-            f"\"{getattr(self, '__schema__')}\"."
-            f"\"{getattr(self, '__table__')}\""
-        )
+        return self.__qualified__
 
     @abstractmethod
-    def random(cls, number: int = 1) -> t.List["BaseModel[T]"]:
+    def random(cls, number: int = 1, batch_size: int = 1000) -> t.Iterator[t.List["BaseModel[T]"]]:
         """
-        Generate given number of random rows for this table
+        Generate and insert given number of random rows for this table (by batches)
+
+        Rows are generated by database with single INSERT ... SELECT query per batch
 
         Args:
             number (int): Number of rows you want to generate
+            batch_size (int): Number of rows generated with single query
+
+        Yields:
+            t.List[BaseModel[T]]: Inserted tables (rows conflicting with existing ones are skipped)
         """
 
-        # Generate random tables
-        tables = [cls._random() for _ in range(number)]
+        if not isinstance(batch_size, int) or batch_size < 1:
+            # Invalid batch size
+            raise ValueError("Batch size must be positive integer value")
 
-        # Insert them
-        cls.insert(*tables)
+        for start in range(0, number, batch_size):
+            query = RandomQuery(
+                tables=[cls],
+                number=min(batch_size, number - start)
+            )
 
-        return tables
+            yield query.execute()
 
 
 class BaseModel(t.Generic[T], metaclass=MetaModel[T]):
@@ -1071,14 +1959,14 @@ class BaseModel(t.Generic[T], metaclass=MetaModel[T]):
 
     @classmethod
     @abstractmethod
-    def _random(cls) -> "BaseModel[T]":
+    def _random_columns(cls) -> t.Dict[str, t.Optional[RandExpr]]:
         """
-        Generate table with random expression
+        Get random expressions of table columns
         """
 
-        return cls(**{
+        return {
             column.name: column.random() for column in cls.columns
-        })
+        }
 
     columns = _classproperty(lambda cls: cls.columns)
     primary_keys = _classproperty(lambda cls: cls.primary_keys)
@@ -1086,11 +1974,18 @@ class BaseModel(t.Generic[T], metaclass=MetaModel[T]):
 
 __all__ = (
     "connect",
+    "transaction",
+    "pool_size",
+    "clear_cache",
+    "batched",
     "Query",
     "SelectQuery",
+    "AggregateQuery",
     "InsertQuery",
     "UpdateQuery",
     "DeleteQuery",
+    "CopyQuery",
+    "RandomQuery",
     "BaseModel",
     "Column"
 )
\ No newline at end of file
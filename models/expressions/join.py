@@ -1,7 +1,6 @@
 # coding=utf-8
 
 import typing as t
-from abc import ABCMeta
 
 if t.TYPE_CHECKING:
     # Should define types
@@ -17,21 +16,24 @@ else:
 # Used types
 Joined = t.Container[Table]
 JoinFunc = t.Callable[[Joined], t.Tuple[str, Table]]
+JoinFactory = t.Callable[["Column", "Column"], JoinFunc]
 
+# (keyword, first column id, second column id) => join function (columns compare by value, not identity)
+_clauses: t.Dict[t.Tuple[str, int, int], JoinFunc] = {}
 
-class JoinFactory(metaclass=ABCMeta):
-    """
-    Base JOIN clause factory
+
+def _make_join(keyword: str) -> JoinFactory:
     """
+    Create JOIN clause factory for specified keyword
 
-    def __init__(self, keyword: str) -> None:
-        """
-        Initialize JOIN clause factory
-        """
+    Args:
+        keyword (str): JOIN keyword
 
-        self._KEYWORD = keyword
+    Returns:
+        JoinFactory: Join factory
+    """
 
-    def __call__(self, first: "Column", second: "Column") -> JoinFunc:
+    def join_columns(first: "Column", second: "Column") -> JoinFunc:
         """
         Join two columns
 
@@ -43,47 +45,68 @@ class JoinFactory(metaclass=ABCMeta):
             JoinFunc: Join function
         """
 
-        def join_clause(joined: Joined) -> t.Tuple[str, Table]:
-            """
-            Perform join of specified columns if given 'joined' tables are already joined
+        key = (keyword, id(first), id(second))
+        clause = _clauses.get(key)
 
-            Args:
-                joined (Joined): Set of already joined tables
+        if clause is None:
+            # Not created yet (columns are defined once per table, so their ids are stable)
+            clause = _clauses[key] = _join_clause(keyword, first, second)
 
-            Returns:
-                t.Tuple[str, Table]: Join expression + joined table
-            """
+        return clause
 
-            if first.table in joined:
-                # Joining table from second column
-                table = second.table
+    return join_columns
 
-            elif second.table in joined:
-                # Joining table from first column
-                table = first.table
 
-            else:
-                # Unknown tables
-                raise ValueError("Can't join - unknown tables provided")
+def _join_clause(keyword: str, first: "Column", second: "Column") -> JoinFunc:
+    """
+    Create join function for specified columns (created once per keyword and pair of columns)
+
+    Args:
+        keyword (str): JOIN keyword
+        first (Column): First column you want to join
+        second (Column): Second column you want to join
+
+    Returns:
+        JoinFunc: Join function
+    """
+
+    # Get columns comparator
+    comparator, *_ = first == second
+
+    # Join queries for both directions
+    first_joined = f"{keyword} {second.table}\n\tON {comparator}"
+    second_joined = f"{keyword} {first.table}\n\tON {comparator}"
+
+    def join_clause(joined: Joined) -> t.Tuple[str, Table]:
+        """
+        Perform join of specified columns if given 'joined' tables are already joined
+
+        Args:
+            joined (Joined): Set of already joined tables
+
+        Returns:
+            t.Tuple[str, Table]: Join expression + joined table
+        """
+
+        if first.table in joined:
+            # Joining table from second column
+            return first_joined, second.table
 
-            # Get columns comparator
-            comparator, *_ = first == second
-            query = (
-                f"{self._KEYWORD} {table}"  # type: ignore # TODO: FIX
-                f"\n\tON {comparator}"
-            )
+        if second.table in joined:
+            # Joining table from first column
+            return second_joined, first.table
 
-            # Join query
-            return query, table
+        # Unknown tables
+        raise ValueError("Can't join - unknown tables provided")
 
-        return join_clause
+    return join_clause
 
 
-join = JoinFactory("JOIN")
-inner_join = JoinFactory("INNER JOIN")
-left_outer_join = JoinFactory("LEFT OUTER JOIN")
-right_outer_join = JoinFactory("RIGHT OUTER JOIN")
-full_outer_join = JoinFactory("FULL OUTER JOIN")
+join = _make_join("JOIN")
+inner_join = _make_join("INNER JOIN")
+left_outer_join = _make_join("LEFT OUTER JOIN")
+right_outer_join = _make_join("RIGHT OUTER JOIN")
+full_outer_join = _make_join("FULL OUTER JOIN")
 
 
 __all__ = (
@@ -8,25 +8,50 @@ T = t.TypeVar("T")
 Expression = t.Tuple[str, t.Optional[t.Dict[str, T]]]
 
 
+class _LogicalStr(str):
+    """
+    Rendered logical expression which remembers its operator and operands (to be flattened by outer expression)
+    """
+
+    __slots__ = ("operator", "operands")
+
+    operator: str
+    operands: t.List[str]
+
+
 def _logical_expr_factory(operator: str) -> t.Callable[..., Expression]:
     """
     Create logical expression func for specified operator
     """
 
+    # Operands separator (built once per operator)
+    separator = f" {operator} "
+
     def logical_expr(*expressions: Expression) -> Expression:
         """
         Combine expressions with AND operation
         """
 
         operands: t.List[str] = []
-        parameters: t.Dict[str, T] = {}
 
-        for expression, param in expressions:
-            # Add to expression
-            operands.append(expression)
-            parameters.update(param or {})
+        for expression, _ in expressions:
+            if isinstance(expression, _LogicalStr) and expression.operator == operator:
+                # Same operator => no need in nested parentheses
+                operands.extend(expression.operands)
+
+            else:
+                operands.append(expression)
+
+        # Merge parameters of all expressions (ones without parameters are skipped)
+        parameters: t.Dict[str, T] = {
+            name: value for _, param in expressions if param for name, value in param.items()
+        }
+
+        combined = _LogicalStr(f"({separator.join(operands)})")
+        combined.operator = operator
+        combined.operands = operands
 
-        return f"({(' ' + operator + ' ').join(operands)})", parameters
+        return combined, parameters
 
     return logical_expr
 
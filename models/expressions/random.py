@@ -1,5 +1,6 @@
 # coding=utf-8
 
+from functools import lru_cache
 from dataclasses import dataclass
 
 
@@ -9,9 +10,34 @@ class RandExpr:
     Random expression class
     """
 
+    __slots__ = ("value", )
+
     value: str
 
+    @classmethod
+    def of(cls, value: str) -> "RandExpr":
+        """
+        Get random expression (same expressions are shared)
+
+        Args:
+            value (str): SQL expression
+
+        Returns:
+            RandExpr: Random expression
+        """
+
+        return _interned(cls, value)
+
+
+@lru_cache(maxsize=1024)
+def _interned(cls: type, value: str) -> RandExpr:
+    """
+    Create random expression (once per class and value)
+    """
+
+    return cls(value)
+
 
 __all__ = (
     "RandExpr",
-)
\ No newline at end of file
+)
@@ -6,13 +6,20 @@ from ..core import Column
 from ..expressions import RandExpr
 
 
+# String values treated as FALSE (compared in lower case)
+_FALSE_STRINGS = frozenset({"0", "f", "false"})
+
+
 class Boolean(Column[bool]):
     """
     PostgreSQL BOOLEAN type
     """
 
     type = "BOOLEAN"
-    _TYPES = {bool, int}
+    _TYPES = (bool, int)
+
+    # Random value expression
+    _RAND_DEFAULT = RandExpr.of("RANDOM() > 0.5")
 
     @classmethod
     def convert(cls, value: t.Any) -> bool:
@@ -22,12 +29,25 @@ class Boolean(Column[bool]):
 
         if isinstance(value, str):
             # String value
-            return value.lower() not in ("0", "f", "false", "FALSE")
+            return value.lower() not in _FALSE_STRINGS
 
         else:
             # Other => use default method
             return super(Boolean, cls).convert(value)
 
+    @classmethod
+    def convert_many(cls, values: t.Iterable[t.Any]) -> t.List[bool]:
+        """
+        Convert values to BOOLEAN type (strings are compared inline)
+        """
+
+        convert = cls.convert
+
+        return [
+            value.lower() not in _FALSE_STRINGS if type(value) is str else convert(value)
+            for value in values
+        ]
+
     def random(self) -> RandExpr:
         """
         Generate random expression for this column
@@ -37,9 +57,7 @@ class Boolean(Column[bool]):
             # Use basic method
             return super(Boolean, self).random()
 
-        return RandExpr(
-            value="RANDOM() > 0.5"
-        )
+        return self._RAND_DEFAULT
 
 
 __all__ = (
@@ -13,7 +13,10 @@ class Date(Column[date]):
     """
 
     type = "DATE"
-    _TYPES = {date}
+    _TYPES = (date, )
+
+    # Random value expression
+    _RAND_DEFAULT = RandExpr.of("CAST(NOW() - RANDOM() * (INTERVAL '20 YEARS') AS DATE)")
 
     @classmethod
     def convert(cls, value: t.Any) -> date:
@@ -21,20 +24,21 @@ class Date(Column[date]):
         Convert value to Date (only ISO format is accepted)
         """
 
-        try:
-            # Use base method
-            return super(Date, cls).convert(value)
+        if type(value) is date:
+            # Already a date
+            return value
 
-        except Exception:
+        if isinstance(value, str):
             try:
                 # Convert from isoformat
                 return date.fromisoformat(value)
 
             except ValueError:
                 # Failed
-                pass
+                raise TypeError(f"Invalid format for {cls.type}")
 
-            raise TypeError(f"Invalid format for {cls.type}")
+        # Use base method
+        return super(Date, cls).convert(value)
 
     def random(self) -> RandExpr:
         """
@@ -45,9 +49,35 @@ class Date(Column[date]):
             # Use basic method
             return super(Date, self).random()
 
-        return RandExpr(
-            value="CAST(NOW() - RANDOM() * (INTERVAL '20 YEARS') AS DATE)"
-        )
+        return self._RAND_DEFAULT
+
+
+def _from_isoformat(value: str) -> datetime:
+    """
+    Convert ISO-formatted string to datetime
+    """
+
+    return datetime.fromisoformat(value)
+
+
+def _from_fractional(value: str) -> datetime:
+    """
+    Convert PostgreSQL-formatted string with fractional seconds (and short time zone) to datetime
+    """
+
+    return datetime.strptime(value + "00", "%Y-%m-%d %H:%M:%S.%f%z")
+
+
+def _from_seconds(value: str) -> datetime:
+    """
+    Convert PostgreSQL-formatted string (with short time zone) to datetime
+    """
+
+    return datetime.strptime(value + "00", "%Y-%m-%d %H:%M:%S%z")
+
+
+# String converters (in order of trying)
+_TIMESTAMP_CONVERTERS = (_from_isoformat, _from_fractional, _from_seconds)
 
 
 class TimeStampTZ(Column[datetime]):
@@ -56,7 +86,10 @@ class TimeStampTZ(Column[datetime]):
     """
 
     type = "TIMESTAMP WITH TIME ZONE"
-    _TYPES = {datetime}
+    _TYPES = (datetime, )
+
+    # Random value expression
+    _RAND_DEFAULT = RandExpr.of("NOW() - RANDOM() * (INTERVAL '20 YEARS')")
 
     @classmethod
     def convert(cls, value: t.Any) -> datetime:
@@ -64,26 +97,21 @@ class TimeStampTZ(Column[datetime]):
         Convert value to Date (only ISO format is accepted)
         """
 
-        try:
+        if not isinstance(value, str):
             # Use base method
             return super(TimeStampTZ, cls).convert(value)
 
-        except Exception:
-            for converter in (
-                lambda v: datetime.fromisoformat(value),
-                lambda v: datetime.strptime(value + "00", "%Y-%m-%d %H:%M:%S.%f%z"),
-                lambda v: datetime.strptime(value + "00", "%Y-%m-%d %H:%M:%S%z")
-            ):
-                try:
-                    # Convert using current converted
-                    return converter(value)
+        for converter in _TIMESTAMP_CONVERTERS:
+            try:
+                # Convert using current converter
+                return converter(value)
 
-                except ValueError:
-                    # Failed
-                    pass
+            except ValueError:
+                # Failed
+                pass
 
-            # Failed to convert with any of converters
-            raise TypeError(f"Invalid format for {cls.type}")
+        # Failed to convert with any of converters
+        raise TypeError(f"Invalid format for {cls.type}")
 
     def random(self) -> RandExpr:
         """
@@ -94,9 +122,7 @@ class TimeStampTZ(Column[datetime]):
             # Use basic method
             return super(TimeStampTZ, self).random()
 
-        return RandExpr(
-            value="NOW() - RANDOM() * (INTERVAL '20 YEARS')"
-        )
+        return self._RAND_DEFAULT
 
 
 __all__ = (
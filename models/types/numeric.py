@@ -3,6 +3,7 @@
 import typing as t
 from abc import ABCMeta
 from decimal import Decimal
+from functools import lru_cache
 
 from ..core import Column
 from ..expressions import RandExpr
@@ -18,30 +19,90 @@ class _Numeric(Column[N], metaclass=ABCMeta):
 
     _MIN: N
     _MAX: N
-    _TYPES = {int, float}
+    _TYPES = (int, float)
 
-    def validate(self, value: N) -> None:
+    # Random value expression (built once per type)
+    _RAND_DEFAULT: t.Optional[RandExpr] = None
+
+    def __init_subclass__(cls, **kwargs: t.Any) -> None:
+        """
+        Initialize numeric column type & build its random value expression
+        """
+
+        super(_Numeric, cls).__init_subclass__(**kwargs)
+
+        if "_RAND_DEFAULT" in cls.__dict__:
+            # Defined by type itself
+            return None
+
+        if getattr(cls, "_MIN", None) is None or getattr(cls, "_MAX", None) is None:
+            # Range is not defined yet
+            return None
+
+        cls._RAND_DEFAULT = RandExpr.of(f"CAST(RANDOM() * ({cls._MAX - cls._MIN}) + {cls._MIN} AS INTEGER)")
+
+    def validate(self, value: N) -> N:
         """
         Check if value is valid for numeric column type
 
         Args:
             value (N): Value you want to validate
 
+        Returns:
+            N: Value converted to column type
+
         Raises:
             ValueError: If value violates NOT NULL constraint
             ValueError: If value is out of range
             TypeError: If invalid value type provided
         """
 
-        super(_Numeric, self).validate(value)
+        # Converted once by base method
+        converted = super(_Numeric, self).validate(value)
+        minimum, maximum = self._MIN, self._MAX
 
-        if not self._MIN <= self.convert(value) <= self._MAX:
+        if converted < minimum or converted > maximum:
             # Out of range
             raise ValueError(
                 f"Invalid value for type {self.type} - "
-                f"must be in range of {self._MIN} - {self._MAX}"
+                f"must be in range of {minimum} - {maximum}"
+            )
+
+        return converted
+
+    def validate_many(self, values: t.Iterable[N]) -> t.List[N]:
+        """
+        Check if all values are valid for numeric column type (range is checked once for all values)
+
+        Args:
+            values (t.Iterable[N]): Values you want to validate
+
+        Returns:
+            t.List[N]: Values converted to column type
+
+        Raises:
+            ValueError: If any value violates NOT NULL constraint
+            ValueError: If any value is out of range (first one is reported)
+            TypeError: If invalid value type provided (first one is reported)
+        """
+
+        converted = super(_Numeric, self).validate_many(values)
+        minimum, maximum = self._MIN, self._MAX
+
+        if converted and (min(converted) < minimum or max(converted) > maximum):
+            # Out of range (first one is reported)
+            index, value = next(
+                (index, value) for index, value in enumerate(converted)
+                if value < minimum or value > maximum
             )
 
+            raise ValueError(
+                f"Invalid value for type {self.type} at index {index} - "
+                f"{value!r} must be in range of {minimum} - {maximum}"
+            )
+
+        return converted
+
     def random(self) -> RandExpr:
         """
         Generate random expression for this column
@@ -52,9 +113,7 @@ class _Numeric(Column[N], metaclass=ABCMeta):
             return super(_Numeric, self).random()
 
         # Valid
-        return RandExpr(
-            value=f"CAST(RANDOM() * ({self._MAX - self._MIN}) + {self._MIN} AS INTEGER)"
-        )
+        return self._RAND_DEFAULT
 
 
 class _Serial(_Numeric[int], metaclass=ABCMeta):
@@ -72,7 +131,7 @@ class Integer(_Numeric[int]):
     """
 
     type = "INTEGER"
-    _TYPES = {int}
+    _TYPES = (int, )
 
     # 4 bytes (32 bits)
     _MIN = 0 - 2 ** 31
@@ -85,7 +144,7 @@ class SmallInt(_Numeric[int]):
     """
 
     type = "SMALLINT"
-    _TYPES = {int}
+    _TYPES = (int, )
 
     # 2 bytes (16 bits)
     _MIN = 0 - 2 ** 15
@@ -114,7 +173,7 @@ class Numeric(_Numeric, metaclass=ABCMeta):
     """
 
     type = "NUMERIC"
-    _TYPES = {int, float, Decimal}
+    _TYPES = (int, float, Decimal)
 
     # Undefined scale and precision
     _SCALE: t.Optional[int] = None
@@ -123,19 +182,6 @@ class Numeric(_Numeric, metaclass=ABCMeta):
     _MIN = None
     _MAX = None
 
-    def random(self) -> RandExpr:
-        """
-        Generate random expression for this column
-        """
-
-        if self.foreign_key is not None:
-            # Use basic method
-            return super(_Numeric, self).random()
-
-        return RandExpr(
-            value=f"RANDOM() * {10 ** (self._PRECISION - self._SCALE)}"
-        )
-
     def __class_getitem__(cls, params: t.Tuple[int, int]) -> t.Type["Numeric"]:
         """
         Set precision and scale
@@ -147,17 +193,15 @@ class Numeric(_Numeric, metaclass=ABCMeta):
             t.Type[Numeric]: Numeric column type
         """
 
-        try:
-            # Unpack parameters
-            precision, scale = params
-
-        except ValueError:
+        if not isinstance(params, tuple) or len(params) != 2:
             # No params
             raise TypeError(
                 f"Precision and scale must be specified "
                 f"for type {cls.type}"
             )
 
+        precision, scale = params
+
         if precision <= 0 or scale < 0:
             # Invalid paramerers
             raise ValueError(
@@ -171,20 +215,30 @@ class Numeric(_Numeric, metaclass=ABCMeta):
                 f"Precision could not be less than scale for type {cls.type}"
             )
 
-        return t.cast(
-            t.Type["Numeric"],
-            type(
-                f"{cls.type}_{precision}_{scale}",
-                (cls, ),
-                {
-                    "type": cls.type + f"({precision}, {scale})",
-                    "_SCALE": scale,
-                    "_PRECISION": precision,
-                    "_MIN": - 10 ** precision,
-                    "_MAX": + 10 ** precision
-                }
-            )
+        return _numeric_type(cls, precision, scale)
+
+
+@lru_cache(maxsize=256)
+def _numeric_type(cls: t.Type[Numeric], precision: int, scale: int) -> t.Type[Numeric]:
+    """
+    Create numeric column type with specified precision and scale (created once per parameters)
+    """
+
+    return t.cast(
+        t.Type[Numeric],
+        type(
+            f"{cls.type}_{precision}_{scale}",
+            (cls, ),
+            {
+                "type": cls.type + f"({precision}, {scale})",
+                "_SCALE": scale,
+                "_PRECISION": precision,
+                "_MIN": - 10 ** precision,
+                "_MAX": + 10 ** precision,
+                "_RAND_DEFAULT": RandExpr.of(f"RANDOM() * {10 ** (precision - scale)}")
+            }
         )
+    )
 
 
 __all__ = (
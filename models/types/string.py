@@ -1,7 +1,7 @@
 # coding=utf-8
 
 import typing as t
-from math import inf
+from functools import lru_cache
 
 from ..core import Column, operator_factory
 from ..expressions import RandExpr
@@ -13,10 +13,13 @@ class VarChar(Column[str]):
     """
 
     type = "VARCHAR"
-    _TYPES = {str}
+    _TYPES = (str, )
 
     # Undefined length
-    _LEN: int = inf
+    _LEN: t.Optional[int] = None
+
+    # Random value expression (built once per type)
+    _RAND_DEFAULT = RandExpr.of("SUBSTRING(MD5(CAST(RANDOM() AS TEXT)) FROM 0)")
 
     def __class_getitem__(cls, length: t.Optional[int] = None) -> t.Type["VarChar"]:
         """
@@ -39,17 +42,7 @@ class VarChar(Column[str]):
                 f"Invalid length specified "
                 f"for column of type {cls.type}")
 
-        return t.cast(
-            t.Type["VarChar"],
-            type(
-                f"{cls.type}_{length}",
-                (cls, ),
-                {
-                    "type": cls.type + f"({length})",
-                    "_LEN": length
-                }
-            )
-        )
+        return _varchar_type(cls, length)
 
     def random(self) -> RandExpr:
         """
@@ -60,13 +53,31 @@ class VarChar(Column[str]):
             # Use basic method
             return super(VarChar, self).random()
 
-        return RandExpr(
-            value=f"SUBSTRING(MD5(CAST(RANDOM() AS TEXT)) FROM 0 FOR {self._LEN})"
-        )
+        return self._RAND_DEFAULT
 
     like = operator_factory("LIKE", "like")
 
 
+@lru_cache(maxsize=256)
+def _varchar_type(cls: t.Type[VarChar], length: int) -> t.Type[VarChar]:
+    """
+    Create VARCHAR column type with specified length (created once per length)
+    """
+
+    return t.cast(
+        t.Type[VarChar],
+        type(
+            f"{cls.type}_{length}",
+            (cls, ),
+            {
+                "type": cls.type + f"({length})",
+                "_LEN": length,
+                "_RAND_DEFAULT": RandExpr.of(f"SUBSTRING(MD5(CAST(RANDOM() AS TEXT)) FROM 0 FOR {length})")
+            }
+        )
+    )
+
+
 __all__ = (
     "VarChar",
 )